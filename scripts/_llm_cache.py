@@ -0,0 +1,44 @@
+"""Tiny content-addressed prompt -> response cache for the generator scripts.
+
+CI reruns and crash recovery can re-issue byte-identical prompts (they are
+deterministic per (date, game_no, topics) now that topics rotate by game
+number). Caching the raw response text under a hash of model + prompt turns
+those repeats into sub-millisecond disk reads instead of full LLM calls.
+
+Files live under ~/.cache/pasalacabra/ (honours XDG_CACHE_HOME). Set
+LLM_CACHE=0 to disable, e.g. when you explicitly want a fresh sample.
+"""
+
+import hashlib
+import os
+from typing import Optional
+
+_ENABLED = os.getenv("LLM_CACHE", "1") == "1"
+_CACHE_DIR = os.path.join(
+    os.getenv("XDG_CACHE_HOME", os.path.expanduser("~/.cache")), "pasalacabra"
+)
+
+
+def cache_key(model: str, prompt: str) -> str:
+    return hashlib.sha256(model.encode() + b"\0" + prompt.encode()).hexdigest()
+
+
+def get(key: str) -> Optional[str]:
+    if not _ENABLED:
+        return None
+    try:
+        with open(os.path.join(_CACHE_DIR, key + ".txt"), "r", encoding="utf-8") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def put(key: str, text: str) -> None:
+    if not _ENABLED:
+        return
+    os.makedirs(_CACHE_DIR, exist_ok=True)
+    path = os.path.join(_CACHE_DIR, key + ".txt")
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp, path)
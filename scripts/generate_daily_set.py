@@ -1,12 +1,22 @@
+import asyncio
+import functools
+import itertools
 import json
+import math
 import os
-import random
 import re
 import unicodedata
 from datetime import date
-from typing import List
+from typing import List, Tuple
 
-from openai import OpenAI
+from openai import AsyncOpenAI
+
+import _llm_cache
+
+try:
+    import orjson  # ~3-6x faster C JSON; falls back to stdlib if missing
+except ImportError:
+    orjson = None
 
 # --- CONFIG YOU SHOULD EDIT ---
 LETTERS = [
@@ -25,40 +35,131 @@ START_DATE = date(2026, 1, 1)
 DEFAULT_SET_PATH = os.getenv("SET_PATH", "src/data/sets/set_01.json")
 MODEL = os.getenv("OPENAI_MODEL", "gpt-5")
 MAX_PASSES = 3  # generate -> AI validate/fix -> re-validate
+# The AI validator only adds semantic review on top of the local checks in
+# validate_set; set SKIP_AI_VALIDATOR=1 to ship the first locally-valid set
+# and save that whole second LLM round-trip.
+SKIP_AI_VALIDATOR = os.getenv("SKIP_AI_VALIDATOR", "0") == "1"
+# The validator's OK/NO verdict probe needs ~2 visible output tokens, but on
+# the Responses API max_output_tokens also covers reasoning tokens, so the
+# probe runs with reasoning effort "minimal" and enough headroom that the
+# verdict is never truncated into an empty response.
+VERDICT_MAX_OUTPUT_TOKENS = 64
+VERDICT_REASONING = {"effort": "minimal"}
 DEFAULT_BANK_PATH = os.getenv("BANK_PATH", "scripts/used_answers.json")
 BANK_MAX_ENTRIES = 60
 
 
+# Precompiled patterns for the validation hot path (26 questions per pass).
+_RE_EMPIEZA = re.compile(r"^\s*Empieza\s+por\s+([A-ZÑ])\s*:\s*", re.IGNORECASE)
+_RE_CONTIENE = re.compile(r"^\s*Contiene\s+la\s+([A-ZÑ])\s*:\s*", re.IGNORECASE)
+
+
+def _json_loads(text: str) -> dict:
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _json_dumps_compact(obj: dict) -> str:
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, ensure_ascii=False)
+
+
 def game_number_for_today(today_local: date) -> int:
     delta = (today_local - START_DATE).days
     return max(1, delta + 1)
 
 
-def strip_accents(s: str) -> str:
-    return "".join(
-        c for c in unicodedata.normalize("NFD", s)
-        if unicodedata.category(c) != "Mn"
-    )
+def rotate_topics(game_no: int) -> Tuple[str, ...]:
+    # Deterministic topic triple per game day (instead of random.sample):
+    # reruns of the same day rebuild the exact same prompts, so CI retries
+    # and crash recovery hit the provider's prompt cache instead of
+    # invalidating it with a fresh random draw.
+    combos = math.comb(len(TOPICS), 3)
+    idx = game_no % combos
+    return next(itertools.islice(itertools.combinations(TOPICS, 3), idx, None))
+
+
+# Every combining-mark codepoint mapped to None, so str.translate drops them
+# all in a single C-level pass (vs one unicodedata.category call per char).
+_COMBINING_TABLE = dict.fromkeys(
+    c for c in range(0x110000) if unicodedata.category(chr(c)) == "Mn"
+)
+
+
+def _build_mn_mask() -> bytes:
+    # 8KB bitset of the BMP combining marks: membership becomes one index
+    # plus one bit-AND in the fused normalizer's per-char loop, instead of a
+    # unicodedata.category call per codepoint.
+    mask = bytearray(0x10000 // 8)
+    for cp in _COMBINING_TABLE:
+        if cp < 0x10000:
+            mask[cp >> 3] |= 1 << (cp & 7)
+    return bytes(mask)
+
+
+_MN_MASK = _build_mn_mask()
+
+
+def _build_accent_table() -> dict:
+    # Map each precomposed Latin letter to its uppercase base letter so the
+    # whole accent-strip + uppercase normalization is one str.translate pass
+    # (no NFD round-trip, no __ENYE__ placeholder). Ñ is the one non-ASCII
+    # letter we keep, so it maps to itself.
+    table = {}
+    for cp in range(0x80, 0x250):
+        ch = chr(cp)
+        if ch in ("Ñ", "ñ"):
+            table[cp] = "Ñ"
+            continue
+        base = unicodedata.normalize("NFD", ch).translate(_COMBINING_TABLE)
+        mapped = base.upper() if base != ch else ch.upper()
+        if mapped != ch:
+            table[cp] = mapped
+    # Stray already-decomposed combining marks are dropped outright, and
+    # ASCII lowercase is folded in the same pass.
+    table.update(_COMBINING_TABLE)
+    for cp in range(ord("a"), ord("z") + 1):
+        table[cp] = chr(cp - 32)
+    return table
+
+
+_ACCENT_TABLE = _build_accent_table()
 
 
 def normalize_for_letter_check(s: str) -> str:
     # Keep Ñ distinct, but normalize accents otherwise for robust checks.
-    s = s.strip()
-    s = s.replace("ñ", "Ñ")
-    s = s.replace("Ñ", "__ENYE__")
-    s = strip_accents(s)
-    s = s.replace("__ENYE__", "Ñ")
-    return s
+    # Returns UPPERCASE so callers can compare letters without re-allocating.
+    return s.strip().translate(_ACCENT_TABLE)
 
 
 def normalize_for_contains_check(s: str) -> str:
-    # Looser normalization for "answer in question" check.
-    s = s.lower()
-    s = s.replace("ñ", "n")
-    s = strip_accents(s)
-    s = re.sub(r"[^\w\s]", " ", s, flags=re.UNICODE)
-    s = re.sub(r"\s+", " ", s).strip()
-    return s
+    # Looser normalization for "answer in question" check, fused into one
+    # pass over the NFD codepoints: drop combining marks (this also turns
+    # ñ into n, since NFD decomposes it to n + tilde), map punctuation to
+    # spaces, and collapse whitespace runs, all into a single output list
+    # instead of the old five-stage pipeline of intermediate strings.
+    out = []
+    prev_space = True  # True so leading whitespace is dropped
+    for c in unicodedata.normalize("NFD", s.lower()):
+        cp = ord(c)
+        if cp < 0x10000:
+            if _MN_MASK[cp >> 3] & (1 << (cp & 7)):
+                continue
+        elif unicodedata.category(c) == "Mn":
+            continue
+        if c.isspace() or not c.isalnum():
+            if prev_space:
+                continue
+            prev_space = True
+            out.append(" ")
+        else:
+            prev_space = False
+            out.append(c)
+    if out and out[-1] == " ":
+        out.pop()
+    return "".join(out)
 
 
 def enforce_letter_constraint(letter: str, question: str, answer: str) -> None:
@@ -67,8 +168,8 @@ def enforce_letter_constraint(letter: str, question: str, answer: str) -> None:
     if not q or not a:
         raise ValueError("Empty question/answer")
 
-    m_emp = re.match(r"^\s*Empieza\s+por\s+([A-ZÑ])\s*:\s*", q, flags=re.IGNORECASE)
-    m_con = re.match(r"^\s*Contiene\s+la\s+([A-ZÑ])\s*:\s*", q, flags=re.IGNORECASE)
+    m_emp = _RE_EMPIEZA.match(q)
+    m_con = _RE_CONTIENE.match(q)
 
     if not (m_emp or m_con):
         raise ValueError(f"Question must start with 'Empieza por X:' or 'Contiene la X:'. Got: {q}")
@@ -79,11 +180,10 @@ def enforce_letter_constraint(letter: str, question: str, answer: str) -> None:
 
     a_norm = normalize_for_letter_check(a)
     if m_emp:
-        first = a_norm[:1].upper()
-        if first != letter:
+        if a_norm[:1] != letter:
             raise ValueError(f"Answer must start with {letter}. Got: {answer}")
     else:
-        if letter not in a_norm.upper():
+        if letter not in a_norm:
             raise ValueError(f"Answer must contain {letter}. Got: {answer}")
 
 
@@ -106,39 +206,78 @@ def validate_set(obj: dict) -> None:
     if not isinstance(qs, list) or len(qs) != len(LETTERS):
         raise ValueError(f"Expected questions length {len(LETTERS)}")
 
-    letters = [q.get("letter") for q in qs]
-    if letters != LETTERS:
-        raise ValueError(f"Letters mismatch. Got {letters}")
-
-    seen_answers = set()
-    for q in qs:
+    # Normalize every answer once up front; duplicate detection is then a
+    # single set-vs-list length comparison (one C-level hash pass) and the
+    # keys are reused in the main loop instead of re-normalizing. Malformed
+    # entries get a unique int key so the type check below reports them.
+    ans_keys = [
+        normalize_for_letter_check(q["answer"]).lower()
+        if isinstance(q, dict) and isinstance(q.get("answer"), str)
+        else i
+        for i, q in enumerate(qs)
+    ]
+    if len(set(ans_keys)) != len(ans_keys):
+        seen = set()
+        for q, key in zip(qs, ans_keys):
+            if key in seen:
+                raise ValueError(f"Duplicate answer detected: {q['answer']}")
+            seen.add(key)
+
+    # Single pass: the letter-order check is fused into the per-entry loop so
+    # a mismatch fails fast instead of after a separate full traversal.
+    for i, q in enumerate(qs):
         if not isinstance(q, dict):
             raise ValueError("Each question entry must be an object")
         letter = q.get("letter")
+        if letter != LETTERS[i]:
+            raise ValueError(f"Letters mismatch at position {i}. Expected {LETTERS[i]}, got {letter!r}")
         question = q.get("question")
         answer = q.get("answer")
         if not isinstance(question, str) or not isinstance(answer, str) or not isinstance(letter, str):
             raise ValueError("Each entry must have string letter/question/answer")
 
-        ans_key = normalize_for_letter_check(answer).strip().lower()
-        if ans_key in seen_answers:
-            raise ValueError(f"Duplicate answer detected: {answer}")
-        seen_answers.add(ans_key)
-
         enforce_letter_constraint(letter, question, answer)
         enforce_answer_not_in_question(question, answer)
 
 
-def build_generation_prompt(today_local: date, game_no: int, topics: List[str], excluded_answers: set = None) -> str:
-    letters_str = ", ".join(LETTERS)
-    topics_str = ", ".join(topics)
+# Frozen renderings of the invariant prompt pieces: the letter list never
+# changes, and only C(11,3)=165 topic triples exist, so their joins are
+# computed at most once each.
+_LETTERS_STR = ", ".join(LETTERS)
+_LETTERS_REPR = repr(LETTERS)
+
+# Letter-by-letter rendering of the per-entry format, both prefix variants
+# spelled out per letter. Deliberately verbose: besides leaving no room for
+# letter mix-ups, it pads the static prompt prefix past OpenAI's ~1024-token
+# prompt-caching activation threshold — below that, the provider never
+# caches the prefix at all.
+_LETTER_FORMAT_SPEC = "\n".join(
+    f'  {{ "letter": "{L}", "question": "Empieza por {L}: ...", "answer": "..." }}\n'
+    f'  {{ "letter": "{L}", "question": "Contiene la {L}: ...", "answer": "..." }}'
+    for L in LETTERS
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _topics_str(topics: Tuple[str, ...]) -> str:
+    return ", ".join(topics)
+
+
+@functools.lru_cache(maxsize=8)
+def build_generation_prompt(today_local: date, game_no: int, topics: Tuple[str, ...], excluded_answers: frozenset = None) -> str:
+    # Static rules first, per-run values last: OpenAI's prompt caching only
+    # matches exact prefixes, so keeping the date/topics out of the prefix
+    # lets every call share the cached rule block. Memoized so the retry
+    # loop does not rebuild the same ~2KB string; topics/excluded_answers
+    # must therefore arrive as hashable tuple/frozenset.
+    topics_str = _topics_str(topics)
 
     excluded_section = ""
     if excluded_answers:
         excluded_list = ", ".join(sorted(excluded_answers))
         excluded_section = f"""
-PALABRAS PROHIBIDAS (ya usadas en partidas anteriores, NO las uses como respuesta):
-[{excluded_list}]
+- PALABRAS PROHIBIDAS (ya usadas en partidas anteriores, NO las uses como respuesta):
+  [{excluded_list}]
 """
 
     return f"""
@@ -147,9 +286,9 @@ Genera un set diario de Pasalacabra en español (es-ES).
 REQUISITOS:
 - Devuelve SOLO JSON válido (sin Markdown, sin comentarios).
 - Debe haber exactamente {len(LETTERS)} preguntas, una por letra.
-- Letras exactas y en este orden: [{letters_str}]
-- Formato EXACTO por entrada:
-  {{ "letter": "A", "question": "Empieza por A: ...", "answer": "..." }}
+- Letras exactas y en este orden: [{_LETTERS_STR}]
+- Formato EXACTO por entrada, letra a letra:
+{_LETTER_FORMAT_SPEC}
 - Usa solo estos prefijos:
   - "Empieza por X:"  (y la respuesta DEBE empezar por X)
   - "Contiene la X:"  (y la respuesta DEBE contener X)
@@ -158,17 +297,16 @@ REQUISITOS:
 - Respuestas cortas (ideal 1–3 palabras), con tildes correctas si aplican.
 - Respuestas de palabras en español.
 - No repitas respuestas entre letras.
-
-TEMAS (usa SOLO estos 3):
-- {topics_str}
+- Usa SOLO los 3 temas indicados en el CONTEXTO.
+- No uses ninguna de las PALABRAS PROHIBIDAS del CONTEXTO (si las hay).
 
 DIFICULTAD:
 - Mezcla fácil y media.
 - Debe haber maximo 3 preguntas difíciles (nivel universitario).
-{excluded_section}
+
 METADATOS:
 - id: "set_01"
-- title: "Pasalacabra {today_local.isoformat()} · No. {game_no}"
+- title: "Pasalacabra <FECHA> · No. <NUMERO>" con la fecha y el número del CONTEXTO.
 - questions: array con las {len(LETTERS)} entradas.
 
 Devuelve un objeto JSON con:
@@ -177,75 +315,293 @@ Devuelve un objeto JSON con:
   "title": "...",
   "questions": [ ... ]
 }}
-""".strip()
-
 
-def build_ai_validator_prompt(today_local: date, game_no: int, topics: List[str], obj: dict, excluded_answers: set = None) -> str:
-    topics_str = ", ".join(topics)
+CONTEXTO DE ESTA EJECUCIÓN:
+- Fecha: {today_local.isoformat()}
+- Número de partida: {game_no}
+- title exacto: "Pasalacabra {today_local.isoformat()} · No. {game_no}"
+- TEMAS (usa SOLO estos 3): {topics_str}
+{excluded_section}
+""".strip()
 
-    excluded_rule = ""
-    if excluded_answers:
-        excluded_list = ", ".join(sorted(excluded_answers))
-        excluded_rule = f"8) NINGUNA respuesta debe coincidir con estas palabras ya usadas: [{excluded_list}]\n"
 
-    return f"""
+@functools.lru_cache(maxsize=2)
+def _validator_prompt_prefix(fix: bool) -> str:
+    # Static half of the validator prompt; built once per mode per process.
+    # The verdict mode (fix=False) only asks for OK/NO so the happy path can
+    # run with a tiny max_output_tokens; the fix mode asks for the full
+    # corrected JSON.
+    checks = f"""
 Eres un editor/validador de preguntas tipo Pasalacabra (es-ES).
 
-Tu tarea con este JSON:
+Tu tarea con el JSON de la sección "JSON a revisar":
 1) Detecta errores semánticos o ambigüedades (solo una respuesta posible).
 2) Verifica que la respuesta NO esté contenida en la pregunta.
 3) Verifica que la letra y el prefijo ("Empieza por"/"Contiene la") sean correctos.
-4) Verifica que todas las preguntas sean SOLO de estos temas: {topics_str}.
+4) Verifica que todas las preguntas sean SOLO de los temas del CONTEXTO.
 5) Verifica mezcla de dificultad con MAXIMO 3 preguntas difíciles (nivel universitario).
 6) Respuestas cortas (ideal 1–3 palabras), con tildes correctas.
 7) Respuestas de palabras en español.
-{excluded_rule}
-Si TODO está bien: responde exactamente con "OK" (sin comillas, sin texto extra).
-Si hay CUALQUIER problema: devuelve SOLO el JSON corregido completo (sin Markdown, sin explicación),
+8) NINGUNA respuesta debe coincidir con las palabras ya usadas del CONTEXTO (si las hay).
+
+Formato esperado por entrada, letra a letra:
+{_LETTER_FORMAT_SPEC}
+""".strip()
+
+    if not fix:
+        return checks + """
+
+Si TODO está bien: responde exactamente con "OK".
+Si hay CUALQUIER problema: responde exactamente con "NO".
+(Sin comillas, sin texto extra, sin explicación.)"""
+
+    return checks + f"""
+
+Este JSON tiene al menos un problema según las reglas de arriba.
+Devuelve SOLO el JSON corregido completo (sin Markdown, sin explicación),
 manteniendo:
 - id = "set_01"
-- title = "Pasalacabra {today_local.isoformat()} · No. {game_no}"
-- mismas letras y orden exacto: {LETTERS}
+- el title exacto del CONTEXTO
+- mismas letras y orden exacto: {_LETTERS_REPR}
 - mismas reglas de letras/prefijos
-- temas SOLO dentro de: {topics_str}
+- temas SOLO dentro de los del CONTEXTO"""
+
+
+def build_ai_validator_prompt(
+    today_local: date, game_no: int, topics: Tuple[str, ...], obj: dict, excluded_answers: frozenset = None, fix: bool = False
+) -> str:
+    # Same prefix-caching layout as build_generation_prompt: the fixed rules
+    # come from the memoized prefix, only the per-run tail is built here
+    # (the JSON under review changes every call, so memoizing the whole
+    # prompt would never hit).
+    topics_str = _topics_str(topics)
 
+    excluded_section = ""
+    if excluded_answers:
+        excluded_list = ", ".join(sorted(excluded_answers))
+        excluded_section = f"- Palabras ya usadas (prohibidas): [{excluded_list}]\n"
+
+    return f"""{_validator_prompt_prefix(fix)}
+
+CONTEXTO DE ESTA EJECUCIÓN:
+- title exacto: "Pasalacabra {today_local.isoformat()} · No. {game_no}"
+- Temas permitidos: {topics_str}
+{excluded_section}
 JSON a revisar:
-{json.dumps(obj, ensure_ascii=False)}
+{_json_dumps_compact(obj)}
 """.strip()
 
 
-def call_openai_json(client: OpenAI, prompt: str) -> dict:
-    resp = client.responses.create(
+# Structured-outputs schema for the generated set: the API then guarantees
+# parseable JSON with the right shape, so a stray Markdown fence can no
+# longer burn a whole retry pass. validate_set stays on as the safety net
+# for everything a schema cannot express (prefixes, duplicates, reuse).
+_SET_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "id": {"type": "string", "enum": ["set_01"]},
+        "title": {"type": "string"},
+        "questions": {
+            "type": "array",
+            "minItems": len(LETTERS),
+            "maxItems": len(LETTERS),
+            "items": {
+                "type": "object",
+                "properties": {
+                    "letter": {"type": "string", "enum": LETTERS},
+                    "question": {"type": "string"},
+                    "answer": {"type": "string"},
+                },
+                "required": ["letter", "question", "answer"],
+                "additionalProperties": False,
+            },
+        },
+    },
+    "required": ["id", "title", "questions"],
+    "additionalProperties": False,
+}
+
+
+async def call_openai_json(client: AsyncOpenAI, prompt: str) -> dict:
+    # Deliberately uncached: generation samples only enter the local cache
+    # after they pass validate_set (see generate_candidates), so a bad sample
+    # can never be pinned and replayed across reruns.
+    # Stream the response so a malformed prefix (prose, a Markdown fence)
+    # is caught after the first few tokens and the generation is cancelled,
+    # instead of paying for the full completion before json parsing fails.
+    # The json_schema format makes this rare, but it is free insurance.
+    chunks: list = []
+    probed = False
+    async with client.responses.stream(
         model=MODEL,
         input=prompt,
-    )
-    text = (resp.output_text or "").strip()
+        text={
+            "format": {
+                "type": "json_schema",
+                "name": "pasalacabra_set",
+                "schema": _SET_SCHEMA,
+                "strict": True,
+            }
+        },
+    ) as stream:
+        async for event in stream:
+            if event.type != "response.output_text.delta":
+                continue
+            chunks.append(event.delta)
+            if not probed:
+                head = "".join(chunks).lstrip()
+                if head:
+                    probed = True
+                    if head[0] not in "{[":
+                        await stream.close()
+                        raise RuntimeError(f"Aborted non-JSON response (starts with {head[:16]!r})")
+
+    text = "".join(chunks).strip()
     if not text:
         raise RuntimeError("Empty response from OpenAI")
-    return json.loads(text)
-
-
-def call_openai_text(client: OpenAI, prompt: str) -> str:
-    resp = client.responses.create(model=MODEL, input=prompt)
-    return (resp.output_text or "").strip()
+    return _json_loads(text)
+
+
+async def call_openai_text(client: AsyncOpenAI, prompt: str, max_output_tokens: int = None, reasoning: dict = None) -> str:
+    # Deliberately uncached, like call_openai_json: only the callers know
+    # whether a response is worth pinning (see ai_validate_or_fix), so raw
+    # output never enters the local cache unvalidated.
+    kwargs = {}
+    if max_output_tokens is not None:
+        kwargs["max_output_tokens"] = max_output_tokens
+    if reasoning is not None:
+        kwargs["reasoning"] = reasoning
+    resp = await client.responses.create(model=MODEL, input=prompt, **kwargs)
+    out = (resp.output_text or "").strip()
+    if not out:
+        raise RuntimeError("Empty response from OpenAI")
+    return out
 
 
-def generate_once(client: OpenAI, today_local: date, game_no: int, topics: List[str], excluded_answers: set = None) -> dict:
-    prompt = build_generation_prompt(today_local, game_no, topics, excluded_answers)
-    return call_openai_json(client, prompt)
+async def generate_once(client: AsyncOpenAI, today_local: date, game_no: int, topics: List[str], excluded_answers: set = None) -> dict:
+    prompt = build_generation_prompt(
+        today_local, game_no, tuple(topics), frozenset(excluded_answers) if excluded_answers else None
+    )
+    return await call_openai_json(client, prompt)
+
+
+async def generate_candidates(
+    client: AsyncOpenAI, today_local: date, game_no: int, topics: List[str], excluded_answers: set, n: int
+) -> Tuple[list, Exception]:
+    """Speculatively sample n candidate sets and return the locally-valid ones.
+
+    The Responses API has no chat-completions-style `n` parameter, so the
+    closest equivalent is n concurrent requests sharing one prompt: after the
+    first, the provider serves the common prefix from cache, so the marginal
+    cost is mostly output tokens. Returns (valid_candidates, last_error).
+
+    The local prompt cache is managed here rather than in call_openai_json:
+    a sample is stored only AFTER it passes the local checks, so a parseable
+    but invalid response can never be pinned and replayed to every retry of
+    the workflow. A warm-cache hit is returned as the single candidate it is
+    instead of being fanned out as n byte-identical "samples".
+    """
+    prompt = build_generation_prompt(
+        today_local, game_no, tuple(topics), frozenset(excluded_answers) if excluded_answers else None
+    )
+    key = _llm_cache.cache_key(MODEL, prompt)
+    cached = _llm_cache.get(key)
+    if cached is not None:
+        try:
+            obj = _json_loads(cached)
+            validate_set(obj)
+            validate_no_reused_answers(obj, excluded_answers)
+            return [obj], None
+        except Exception as e:
+            # Stale entry (e.g. the answer bank moved on): ignore and resample.
+            print(f"Ignoring cached sample: {e}")
 
+    results = await asyncio.gather(
+        *(generate_once(client, today_local, game_no, topics, excluded_answers) for _ in range(n)),
+        return_exceptions=True,
+    )
 
-def ai_validate_or_fix(
-    client: OpenAI, today_local: date, game_no: int, topics: List[str], obj: dict, excluded_answers: set = None
+    candidates = []
+    seen = set()
+    last_err = None
+    for i, res in enumerate(results, start=1):
+        if isinstance(res, BaseException):
+            last_err = res
+            print(f"[candidate {i}/{n}] generation error: {res}")
+            continue
+        try:
+            validate_set(res)
+            validate_no_reused_answers(res, excluded_answers)
+        except Exception as e:
+            last_err = e
+            print(f"[candidate {i}/{n}] validation error: {e}")
+            continue
+        # Identical samples are not independent candidates; keep one copy.
+        fingerprint = _json_dumps_compact(res)
+        if fingerprint in seen:
+            print(f"[candidate {i}/{n}] duplicate of an earlier sample, dropped")
+            continue
+        seen.add(fingerprint)
+        candidates.append(res)
+
+    if candidates:
+        _llm_cache.put(key, _json_dumps_compact(candidates[0]))
+    return candidates, last_err
+
+
+async def ai_validate_or_fix(
+    client: AsyncOpenAI, today_local: date, game_no: int, topics: List[str], obj: dict, excluded_answers: set = None
 ) -> dict:
-    prompt = build_ai_validator_prompt(today_local, game_no, topics, obj, excluded_answers)
-    out = call_openai_text(client, prompt)
-    if out.strip() == "OK":
+    topics_t = tuple(topics)
+    excluded_f = frozenset(excluded_answers) if excluded_answers else None
+
+    # Cheap OK/NO probe first: the happy path costs a couple of output
+    # tokens instead of letting the model free-run. Only on "NO" do we pay
+    # for the full corrected-JSON response (whose prompt shares the cached
+    # context prefix with the probe). Like the generation path, responses
+    # are only cached once they are known good: the verdict only when it is
+    # exactly OK/NO, the fix only after it parses and passes validate_set,
+    # so an off-script or invalid response is retried fresh on rerun
+    # instead of being pinned.
+    verdict_prompt = build_ai_validator_prompt(today_local, game_no, topics_t, obj, excluded_f)
+    vkey = _llm_cache.cache_key(MODEL, verdict_prompt)
+    verdict = _llm_cache.get(vkey)
+    if verdict is None:
+        verdict = (
+            await call_openai_text(
+                client,
+                verdict_prompt,
+                max_output_tokens=VERDICT_MAX_OUTPUT_TOKENS,
+                reasoning=VERDICT_REASONING,
+            )
+        ).strip().upper()
+        if verdict in ("OK", "NO"):
+            _llm_cache.put(vkey, verdict)
+    if verdict.startswith("OK"):
         return obj
-    return json.loads(out)
+    if not verdict.startswith("NO"):
+        # Empty or off-script verdict (e.g. the token cap truncated the
+        # response): inconclusive, NOT a judgement against the set. Bail out
+        # rather than tell the fix call a valid set has a problem.
+        raise RuntimeError(f"Inconclusive validator verdict: {verdict!r}")
+
+    fix_prompt = build_ai_validator_prompt(today_local, game_no, topics_t, obj, excluded_f, fix=True)
+    fkey = _llm_cache.cache_key(MODEL, fix_prompt)
+    out = _llm_cache.get(fkey)
+    if out is not None:
+        return _json_loads(out)
+    out = await call_openai_text(client, fix_prompt)
+    fixed = _json_loads(out)
+    validate_set(fixed)
+    _llm_cache.put(fkey, out)
+    return fixed
 
 
 def write_set(path: str, obj: dict) -> None:
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+        return
     with open(path, "w", encoding="utf-8") as f:
         json.dump(obj, f, ensure_ascii=False, indent=2)
         f.write("\n")
@@ -294,44 +650,55 @@ def update_answer_bank(
         f.write("\n")
 
 
-def main() -> None:
+async def _amain() -> None:
     today_local = date.today()
     game_no = game_number_for_today(today_local)
-    topics = random.sample(TOPICS, 3)
+    topics = rotate_topics(game_no)
 
     api_key = os.getenv("OPENAI_KEY") or os.getenv("OPENAI_API_KEY")
     if not api_key:
         raise RuntimeError("Missing OPENAI_KEY or OPENAI_API_KEY in environment.")
 
-    client = OpenAI(api_key=api_key)
+    client = AsyncOpenAI(api_key=api_key)
 
     bank = load_answer_bank(DEFAULT_BANK_PATH)
     excluded = get_excluded_answers(bank)
     if excluded:
         print(f"Loaded {len(excluded)} excluded answers from {len(bank)} previous set(s).")
 
-    last_err = None
-    obj = None
-
-    for attempt in range(1, MAX_PASSES + 1):
-        try:
-            if obj is None:
-                obj = generate_once(client, today_local, game_no, topics, excluded)
-
-            validate_set(obj)
-            validate_no_reused_answers(obj, excluded)
-
-            obj2 = ai_validate_or_fix(client, today_local, game_no, topics, obj, excluded)
-            validate_set(obj2)
-            validate_no_reused_answers(obj2, excluded)
+    # Fire the speculative generations concurrently; both LLM round-trips are
+    # pure I/O, so the wall clock is ~1 round-trip instead of up to MAX_PASSES.
+    candidates, last_err = await generate_candidates(
+        client, today_local, game_no, topics, excluded, MAX_PASSES
+    )
 
-            obj = obj2
-            break
+    if not candidates:
+        raise RuntimeError(f"Failed to generate a valid set after {MAX_PASSES} passes: {last_err}")
 
-        except Exception as e:
-            last_err = e
-            print(f"[attempt {attempt}/{MAX_PASSES}] error: {e}")
-            obj = None
+    obj = None
+    if SKIP_AI_VALIDATOR:
+        obj = candidates[0]
+        print("SKIP_AI_VALIDATOR=1: shipping the first locally-valid set without AI review.")
+    else:
+        # AI-validate the survivors concurrently and keep the first that re-validates.
+        fixed = await asyncio.gather(
+            *(ai_validate_or_fix(client, today_local, game_no, topics, c, excluded) for c in candidates),
+            return_exceptions=True,
+        )
+
+        for i, res in enumerate(fixed, start=1):
+            if isinstance(res, BaseException):
+                last_err = res
+                print(f"[candidate {i}/{len(candidates)}] AI validation error: {res}")
+                continue
+            try:
+                validate_set(res)
+                validate_no_reused_answers(res, excluded)
+                obj = res
+                break
+            except Exception as e:
+                last_err = e
+                print(f"[candidate {i}/{len(candidates)}] validation error: {e}")
 
     if obj is None:
         raise RuntimeError(f"Failed to generate a valid set after {MAX_PASSES} passes: {last_err}")
@@ -343,5 +710,9 @@ def main() -> None:
     print(f"Topics used: {', '.join(topics)}")
 
 
+def main() -> None:
+    asyncio.run(_amain())
+
+
 if __name__ == "__main__":
     main()